@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import base64
 import logging
-from pathlib import Path
+import re
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
@@ -23,6 +24,7 @@ from .const import (
     ATTR_FILENAME,
     ATTR_SEQUENCE,
     API_ENDPOINT,
+    MAX_FILE_SIZE,
 )
 from .coordinator import ImageManagerCoordinator
 from .image_storage import ImageStorageManager
@@ -39,10 +41,28 @@ _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.IMAGE]
 
+# Base64 alphabet, padding and line breaks; anything else is rejected undecoded
+_B64_RE = re.compile(r"^[A-Za-z0-9+/=\s]+$")
+_MAX_IMAGE_DATA_LENGTH = 4 * ((MAX_FILE_SIZE + 2) // 3)
+
+
+def _b64decode(image_data_b64: str) -> bytes:
+    """Check the base64 alphabet and decode (runs in executor)."""
+    if not _B64_RE.match(image_data_b64):
+        raise ValueError("Image data must be base64 encoded")
+    return base64.b64decode(image_data_b64)
+
+
 # Service schemas
 SERVICE_UPLOAD_IMAGE_SCHEMA = vol.Schema(
     {
-        vol.Required(ATTR_IMAGE_DATA): str,  # Base64 encoded image data
+        vol.Required(ATTR_IMAGE_DATA): vol.All(  # Base64 encoded image data
+            str,
+            vol.Length(
+                max=_MAX_IMAGE_DATA_LENGTH,
+                msg=f"File too large. Maximum size is {MAX_FILE_SIZE // (1024 * 1024)}MB",
+            ),
+        ),
         vol.Optional(ATTR_FILENAME): str,
     }
 )
@@ -64,8 +84,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Image Manager from a config entry."""
-    max_images = entry.options.get(
-        CONF_MAX_IMAGES, entry.data.get(CONF_MAX_IMAGES, DEFAULT_MAX_IMAGES)
+    max_images = entry.options.get(CONF_MAX_IMAGES) or entry.data.get(
+        CONF_MAX_IMAGES, DEFAULT_MAX_IMAGES
     )
     _LOGGER.info(
         "Setting up Image Manager with max_images: %s (from config entry data: %s, options: %s)",
@@ -76,6 +96,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Initialize storage manager
     storage_manager = ImageStorageManager(hass, entry.entry_id, max_images)
+    await storage_manager.async_setup()
+
+    # Clean up excess images if max_images was reduced, before the coordinator
+    # indexes them
+    await storage_manager.trim_images(max_images)
 
     # Initialize coordinator
     coordinator = ImageManagerCoordinator(hass, storage_manager)
@@ -83,37 +108,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Fetch initial data
     await coordinator.async_config_entry_first_refresh()
 
-    # Clean up excess images if max_images was reduced
-    images = await storage_manager.get_images()
-    if len(images) > max_images:
-        excess_count = len(images) - max_images
-        _LOGGER.info(
-            "Cleaning up %d excess images (max_images reduced to %d)",
-            excess_count,
-            max_images,
-        )
-        for _ in range(excess_count):
-            oldest_image = images.pop(0)
-            try:
-                file_path = await storage_manager.get_image_path(
-                    oldest_image["sequence"]
-                )
-                if file_path and file_path.exists():
-                    file_path.unlink()
-                    _LOGGER.info("Removed excess image: %s", oldest_image["filename"])
-            except (OSError, Exception) as err:
-                _LOGGER.warning(
-                    "Failed to remove excess image %s: %s",
-                    oldest_image["filename"],
-                    err,
-                )
-
-        # Update metadata
-        metadata = await storage_manager.load_metadata()
-        metadata["images"] = images
-        await storage_manager.save_metadata(metadata)
-        _LOGGER.info("Cleaned up %d excess images", excess_count)
-
     # Store coordinator in hass data
     hass.data[DOMAIN][entry.entry_id] = {
         "coordinator": coordinator,
@@ -171,7 +165,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+        await entry_data["coordinator"].async_shutdown()
 
     return unload_ok
 
@@ -189,12 +184,10 @@ async def _async_register_services(
 
     async def async_upload_image(call: ServiceCall) -> None:
         """Handle upload image service call."""
-        import base64
-
         try:
-            # Decode base64 image data
+            # Validate and decode base64 image data off the event loop
             image_data_b64 = call.data[ATTR_IMAGE_DATA]
-            image_data = base64.b64decode(image_data_b64)
+            image_data = await hass.async_add_executor_job(_b64decode, image_data_b64)
             filename = call.data.get(ATTR_FILENAME)
 
             # Upload image
@@ -22,15 +22,25 @@ IMAGES_DIR: Final = "images"
 METADATA_FILE: Final = "metadata.json"
 IMAGE_FILE_PATTERN: Final = "img_{sequence:03d}_{timestamp}_{hash}_{filename}.png"
 GITKEEP_FILE: Final = ".gitkeep"
+UPLOAD_DIR: Final = "uploads"
+UPLOAD_FILE_SUFFIX: Final = ".upload"
 
 # Supported formats
 SUPPORTED_FORMATS: Final = ["JPEG", "PNG"]
 OUTPUT_FORMAT: Final = "PNG"
 JPEG_QUALITY: Final = 100
 
+
 # Entity configuration
-ENTITY_ID_PATTERN: Final = "image.image_manager_{sequence}"
-ENTITY_NAME_PATTERN: Final = "Image Manager {sequence}"
+def entity_id_for(sequence: int) -> str:
+    """Return the entity ID for an image sequence."""
+    return f"image.image_manager_{sequence}"
+
+
+def entity_name_for(sequence: int) -> str:
+    """Return the entity name for an image sequence."""
+    return f"Image Manager {sequence}"
+
 
 # Services
 SERVICE_UPLOAD_IMAGE: Final = "upload_image"
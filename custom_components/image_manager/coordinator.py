@@ -2,20 +2,70 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from datetime import timedelta
+import hashlib
 import logging
-from typing import Any, Dict, List
+import os
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.json import json_bytes
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN
+from .const import API_ENDPOINT, DOMAIN, entity_id_for
 from .image_storage import ImageStorageManager
 
 _LOGGER = logging.getLogger(__name__)
 
+# Status entry template. The integers are ASCII, the URLs and entity ID are
+# taken from the record as plain ASCII strings, so only the filename needs
+# escaping.
+_STATUS_IMAGE_TEMPLATE = (
+    b'{"sequence":%d,"filename":%b,"timestamp":%d,"url":%b,'
+    b'"pdf_url":%b,"entity_id":%b}'
+)
+_STATUS_ENVELOPE_TEMPLATE = (
+    b'{"images":[%b],"count":%d,"max_images":%d,"storage_full":false}'
+)
 
-class ImageManagerCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
+
+def _plain_json_string(value: str) -> bytes:
+    """Quote a string that JSON-encodes to itself, or raise ValueError."""
+    encoded = value.encode("ascii")
+    if b'"' in encoded or b"\\" in encoded or not value.isprintable():
+        raise ValueError(f"String needs escaping: {value!r}")
+    return b'"' + encoded + b'"'
+
+
+def _serialize_status(images: list[Dict[str, Any]], max_images: int) -> bytes:
+    """Serialize the status payload by filling in byte templates."""
+    # Records of an unexpected shape raise TypeError or ValueError
+    entries = []
+    for img in images:
+        sequence, timestamp = img["sequence"], img["timestamp"]
+        # %d would silently truncate anything but an int
+        if type(sequence) is not int or type(timestamp) is not int:
+            raise TypeError(f"Unexpected status record for sequence {sequence!r}")
+        pdf_url = img["pdf_url"]
+        entries.append(
+            _STATUS_IMAGE_TEMPLATE
+            % (
+                sequence,
+                json_bytes(img["filename"]),
+                timestamp,
+                _plain_json_string(img["url"]),
+                b"null" if pdf_url is None else _plain_json_string(pdf_url),
+                _plain_json_string(img["entity_id"]),
+            )
+        )
+    return _STATUS_ENVELOPE_TEMPLATE % (b",".join(entries), len(images), max_images)
+
+
+class ImageManagerCoordinator(DataUpdateCoordinator[Mapping[int, Dict[str, Any]]]):
     """Coordinator to manage image data updates."""
 
     def __init__(
@@ -25,6 +75,12 @@ class ImageManagerCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
     ) -> None:
         """Initialize the coordinator."""
         self.storage_manager = storage_manager
+        self._by_seq: Dict[int, Dict[str, Any]] = {}
+        self._seq_set: frozenset[int] = frozenset()
+        self._paths: Dict[int, tuple[str, str | None]] = {}
+        self._indexed_paths: frozenset[str] = frozenset()
+        self._file_stats: Dict[str, os.stat_result] = {}
+        self._status_cache: tuple[bytes, str] | None = None
 
         super().__init__(
             hass,
@@ -33,31 +89,172 @@ class ImageManagerCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
             update_interval=timedelta(seconds=30),
         )
 
-    async def _async_update_data(self) -> List[Dict[str, Any]]:
-        """Fetch data from the storage manager."""
+        self._refresh_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=0.3,
+            immediate=False,
+            function=self._async_publish_data,
+        )
+
+    async def _async_update_data(self) -> Mapping[int, Dict[str, Any]]:
+        """Fetch data from the storage manager, keyed by sequence."""
         try:
-            return await self.storage_manager.get_images()
+            images = await self.storage_manager.get_images()
         except Exception as err:
             raise UpdateFailed(f"Error communicating with storage: {err}") from err
 
+        return self._set_index(
+            {image["sequence"]: self._with_links(image) for image in images}
+        )
+
+    def _with_links(self, image: Dict[str, Any]) -> Dict[str, Any]:
+        """Return an image record with its URLs and entity ID precomputed."""
+        # Reuse the indexed record for the same file. Otherwise copy, since
+        # storage writes its own records back to the metadata file.
+        sequence = image["sequence"]
+        current = self._by_seq.get(sequence)
+        if current is not None and current["filename"] == image["filename"]:
+            return current
+
+        return {
+            **image,
+            "url": f"{API_ENDPOINT}/{sequence}",
+            "pdf_url": (
+                f"{API_ENDPOINT}/{sequence}/pdf" if image.get("pdf_filename") else None
+            ),
+            "entity_id": entity_id_for(sequence),
+        }
+
+    def _set_index(
+        self, images: Dict[int, Dict[str, Any]]
+    ) -> Mapping[int, Dict[str, Any]]:
+        """Store the sequence index and return a read-only view of it."""
+        self._by_seq = images
+        self._seq_set = frozenset(images)
+        self._status_cache = None
+
+        # Resolve file paths up front so serving a file needs no storage lookup
+        storage_path = self.storage_manager._storage_path
+        self._paths = {
+            seq: (
+                str(storage_path / info["filename"]),
+                (
+                    str(storage_path / info["pdf_filename"])
+                    if info.get("pdf_filename")
+                    else None
+                ),
+            )
+            for seq, info in images.items()
+        }
+        self._indexed_paths = frozenset(
+            path for paths in self._paths.values() for path in paths if path
+        )
+        # Stored files are never rewritten, so stats stay valid while indexed
+        self._file_stats = {
+            path: st
+            for path, st in self._file_stats.items()
+            if path in self._indexed_paths
+        }
+        return MappingProxyType(images)
+
+    async def _async_set_images(self, images: Dict[int, Dict[str, Any]]) -> None:
+        """Publish a locally updated sequence index without a storage refresh."""
+        # Readers see the index at once; listener updates are debounced
+        self.data = self._set_index(images)
+        await self._refresh_debouncer.async_call()
+
+    @callback
+    def _async_publish_data(self) -> None:
+        """Push the current index to listeners."""
+        self.async_set_updated_data(self.data)
+
+    async def async_shutdown(self) -> None:
+        """Cancel pending listener updates and shut down the coordinator."""
+        self._refresh_debouncer.async_cancel()
+        await super().async_shutdown()
+
+    def get_status_bytes(self) -> tuple[bytes, str]:
+        """Return the serialized status payload and its ETag value."""
+        # Built once per index change and reused until the images change
+        if self._status_cache is None:
+            images = list(self._by_seq.values())
+            max_images = self.storage_manager.max_images
+            try:
+                body = _serialize_status(images, max_images)
+            except (AttributeError, KeyError, TypeError, ValueError) as err:
+                _LOGGER.debug("Falling back to generic status serialization: %s", err)
+                body = json_bytes(
+                    {
+                        "images": [
+                            {
+                                "sequence": img["sequence"],
+                                "filename": img["filename"],
+                                "timestamp": img["timestamp"],
+                                "url": img["url"],
+                                "pdf_url": img["pdf_url"],
+                                "entity_id": img["entity_id"],
+                            }
+                            for img in images
+                        ],
+                        "count": len(images),
+                        "max_images": max_images,
+                        "storage_full": False,  # Always allow uploads, auto-rotation handles capacity
+                    }
+                )
+            etag_value = hashlib.blake2b(body, digest_size=8).hexdigest()
+            self._status_cache = (body, etag_value)
+        return self._status_cache
+
     async def async_upload_image(
         self, image_data: bytes, filename: str | None = None
     ) -> Dict[str, Any]:
         """Upload a new image."""
         try:
-            image_info = await self.storage_manager.store_image(image_data, filename)
-            await self.async_request_refresh()
-            return image_info
+            image_info, rotated_sequence = await self.storage_manager.store_image(
+                image_data, filename
+            )
+            return await self._async_add_image(image_info, rotated_sequence)
+        except Exception as err:
+            _LOGGER.error("Failed to upload image: %s", err)
+            raise
+
+    async def async_upload_image_file(
+        self, upload_path: Path, filename: str | None = None
+    ) -> Dict[str, Any]:
+        """Upload a new image from a temporary file, which is consumed."""
+        try:
+            (
+                image_info,
+                rotated_sequence,
+            ) = await self.storage_manager.store_image_file(upload_path, filename)
+            return await self._async_add_image(image_info, rotated_sequence)
         except Exception as err:
             _LOGGER.error("Failed to upload image: %s", err)
             raise
 
+    async def _async_add_image(
+        self, image_info: Dict[str, Any], rotated_sequence: int | None
+    ) -> Dict[str, Any]:
+        """Add a stored image to the index and return its indexed record."""
+        record = self._with_links(image_info)
+
+        # Apply the rotation storage reports instead of re-reading metadata
+        images = dict(self._by_seq)
+        if rotated_sequence is not None:
+            images.pop(rotated_sequence, None)
+        images[record["sequence"]] = record
+        await self._async_set_images(images)
+        return record
+
     async def async_delete_image(self, sequence: int) -> bool:
         """Delete an image by sequence number."""
         try:
             result = await self.storage_manager.delete_image(sequence)
             if result:
-                await self.async_request_refresh()
+                await self._async_set_images(
+                    {seq: info for seq, info in self._by_seq.items() if seq != sequence}
+                )
             return result
         except Exception as err:
             _LOGGER.error("Failed to delete image %d: %s", sequence, err)
@@ -67,7 +264,7 @@ class ImageManagerCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
         """Delete all images."""
         try:
             count = await self.storage_manager.delete_all_images()
-            await self.async_request_refresh()
+            await self._async_set_images({})
             return count
         except Exception as err:
             _LOGGER.error("Failed to delete all images: %s", err)
@@ -83,21 +280,17 @@ class ImageManagerCoordinator(DataUpdateCoordinator[List[Dict[str, Any]]]):
 
     async def async_get_image_path(self, sequence: int) -> str | None:
         """Get image file path by sequence number."""
-        try:
-            path = await self.storage_manager.get_image_path(sequence)
-            return str(path) if path else None
-        except Exception as err:
-            _LOGGER.error("Failed to get image path for %d: %s", sequence, err)
-            return None
+        return self._paths.get(sequence, (None, None))[0]
 
     async def async_get_pdf_path(self, sequence: int) -> str | None:
         """Get PDF file path by sequence number."""
-        try:
-            image_info = await self.storage_manager.get_image_info(sequence)
-            if image_info and "pdf_filename" in image_info:
-                path = self.storage_manager._storage_path / image_info["pdf_filename"]
-                return str(path)
-            return None
-        except Exception as err:
-            _LOGGER.error("Failed to get PDF path for %d: %s", sequence, err)
-            return None
+        return self._paths.get(sequence, (None, None))[1]
+
+    async def async_get_file_stat(self, path: str) -> os.stat_result:
+        """Return the stat result of an indexed image or PDF file."""
+        if (st := self._file_stats.get(path)) is None:
+            st = await self.hass.async_add_executor_job(os.stat, path)
+            # Only cache files that are still indexed after the executor hop
+            if path in self._indexed_paths:
+                self._file_stats[path] = st
+        return st
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 import logging
+from pathlib import Path
 from typing import Any, Dict
 
 from homeassistant.components.image import ImageEntity
@@ -12,11 +14,42 @@ from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import API_ENDPOINT, DOMAIN, ENTITY_ID_PATTERN, ENTITY_NAME_PATTERN
+from .const import API_ENDPOINT, DOMAIN, entity_id_for, entity_name_for
 from .coordinator import ImageManagerCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Image bytes shared by all entities, keyed by path and evicted least
+# recently used first once their total size exceeds the limit
+_IMAGE_CACHE_MAX_BYTES = 32 * 1024 * 1024
+_image_cache: OrderedDict[str, tuple[float, int, bytes]] = OrderedDict()
+_image_cache_bytes = 0
+
+
+def _cache_get(path: str, mtime: float, size: int) -> bytes | None:
+    """Return cached bytes for path if the file is unchanged."""
+    entry = _image_cache.get(path)
+    if entry is None or entry[:2] != (mtime, size):
+        return None
+    _image_cache.move_to_end(path)
+    return entry[2]
+
+
+def _cache_put(path: str, mtime: float, size: int, data: bytes) -> None:
+    """Cache bytes for path, evicting older entries to stay within the limit."""
+    global _image_cache_bytes  # pylint: disable=global-statement
+
+    if len(data) > _IMAGE_CACHE_MAX_BYTES:
+        return
+    old = _image_cache.pop(path, None)
+    if old is not None:
+        _image_cache_bytes -= len(old[2])
+    _image_cache[path] = (mtime, size, data)
+    _image_cache_bytes += len(data)
+    while _image_cache_bytes > _IMAGE_CACHE_MAX_BYTES:
+        _, (_, _, evicted) = _image_cache.popitem(last=False)
+        _image_cache_bytes -= len(evicted)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -29,42 +62,35 @@ async def async_setup_entry(
     ]
 
     # Create entities for existing images
-    entities = []
-    for image_info in coordinator.data:
-        entities.append(ImageManagerImageEntity(coordinator, image_info))
+    entities: dict[int, ImageManagerImageEntity] = {
+        sequence: ImageManagerImageEntity(coordinator, image_info)
+        for sequence, image_info in coordinator.data.items()
+    }
 
-    async_add_entities(entities)
+    async_add_entities(list(entities.values()))
 
     # Set up listener for coordinator updates (additions and removals)
     @callback
     def _async_update_entities():
         """Update entities based on current coordinator data."""
-        current_sequences = {entity.sequence for entity in entities}
-        data_sequences = {img["sequence"] for img in coordinator.data}
+        data_sequences = coordinator.data.keys()
 
         # Add new entities
-        new_entities = []
-        for image_info in coordinator.data:
-            sequence = image_info["sequence"]
-            if sequence not in current_sequences:
-                new_entity = ImageManagerImageEntity(coordinator, image_info)
-                new_entities.append(new_entity)
-                entities.append(new_entity)
+        new_entities = {
+            sequence: ImageManagerImageEntity(coordinator, coordinator.data[sequence])
+            for sequence in data_sequences - entities.keys()
+        }
 
         if new_entities:
-            async_add_entities(new_entities)
+            entities.update(new_entities)
+            async_add_entities(list(new_entities.values()))
 
         # Remove entities that no longer exist
-        entities_to_remove = []
-        for entity in entities:
-            if entity.sequence not in data_sequences:
-                entities_to_remove.append(entity)
-                entities.remove(entity)
-
-        # Remove from entity registry
-        if entities_to_remove:
+        removed_sequences = entities.keys() - data_sequences
+        if removed_sequences:
             registry = er.async_get(hass)
-            for entity in entities_to_remove:
+            for sequence in removed_sequences:
+                entity = entities.pop(sequence)
                 registry.async_remove(entity.entity_id)
                 _LOGGER.info("Removed entity %s for deleted image", entity.entity_id)
 
@@ -75,10 +101,12 @@ async def async_setup_entry(
 class ImageManagerImageEntity(CoordinatorEntity[ImageManagerCoordinator], ImageEntity):
     """Representation of an Image Manager image entity."""
 
-    @property
-    def access_tokens(self) -> list:
-        """Return access tokens for compatibility with HA image platform."""
-        return ["public"]
+    # Shared static token for compatibility with HA image platform
+    access_tokens = ["public"]
+
+    @callback
+    def async_update_token(self) -> None:
+        """Keep the static public token instead of rotating it."""
 
     def __init__(
         self,
@@ -88,24 +116,21 @@ class ImageManagerImageEntity(CoordinatorEntity[ImageManagerCoordinator], ImageE
         """Initialize the image entity."""
         super().__init__(coordinator)
         self._image_info = image_info
+        self._attr_cache: tuple[Dict[str, Any], Dict[str, Any]] | None = None
         self.sequence = image_info["sequence"]
 
         # Set entity attributes
         self._attr_unique_id = f"{DOMAIN}_{self.sequence}"
-        self._attr_name = ENTITY_NAME_PATTERN.format(sequence=self.sequence)
-        self._attr_entity_id = ENTITY_ID_PATTERN.format(sequence=self.sequence)
+        self._attr_name = entity_name_for(self.sequence)
+        self._attr_entity_id = entity_id_for(self.sequence)
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        if not self.coordinator.last_update_success:
-            return False
-
-        # Check if this image still exists in coordinator data
-        for image_info in self.coordinator.data:
-            if image_info["sequence"] == self.sequence:
-                return True
-        return False
+        return (
+            self.coordinator.last_update_success
+            and self.sequence in self.coordinator._seq_set
+        )
 
     @property
     def image_url(self) -> str | None:
@@ -123,20 +148,18 @@ class ImageManagerImageEntity(CoordinatorEntity[ImageManagerCoordinator], ImageE
     @property
     def extra_state_attributes(self) -> Dict[str, Any] | None:
         """Return extra state attributes."""
-        if not self.available:
+        if not self.coordinator.last_update_success:
             return None
 
-        # Find current image info
-        current_info = None
-        for image_info in self.coordinator.data:
-            if image_info["sequence"] == self.sequence:
-                current_info = image_info
-                break
-
+        current_info = self.coordinator.data.get(self.sequence)
         if not current_info:
             return None
 
-        return {
+        # Reuse the attributes built for this exact info object
+        if self._attr_cache and self._attr_cache[0] is current_info:
+            return self._attr_cache[1]
+
+        attributes = {
             "sequence": current_info["sequence"],
             "filename": current_info["filename"],
             "created_at": current_info["created_at"],
@@ -145,6 +168,8 @@ class ImageManagerImageEntity(CoordinatorEntity[ImageManagerCoordinator], ImageE
             "height": current_info["height"],
             "timestamp": current_info["timestamp"],
         }
+        self._attr_cache = (current_info, attributes)
+        return attributes
 
     async def async_image(self) -> bytes | None:
         """Return the image content."""
@@ -156,11 +181,19 @@ class ImageManagerImageEntity(CoordinatorEntity[ImageManagerCoordinator], ImageE
             if not image_path:
                 return None
 
+            # Serve from cache while the file on disk is unchanged
+            stat = await self.coordinator.async_get_file_stat(image_path)
+            cached = _cache_get(image_path, stat.st_mtime, stat.st_size)
+            if cached is not None:
+                return cached
+
             # Read image file
-            import aiofiles
+            image_bytes = await self.hass.async_add_executor_job(
+                Path(image_path).read_bytes
+            )
 
-            async with aiofiles.open(image_path, "rb") as f:
-                return await f.read()
+            _cache_put(image_path, stat.st_mtime, stat.st_size, image_bytes)
+            return image_bytes
 
         except Exception as err:
             _LOGGER.error("Failed to read image %d: %s", self.sequence, err)
@@ -170,9 +203,8 @@ class ImageManagerImageEntity(CoordinatorEntity[ImageManagerCoordinator], ImageE
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         # Update image info if it still exists
-        for image_info in self.coordinator.data:
-            if image_info["sequence"] == self.sequence:
-                self._image_info = image_info
-                break
+        image_info = self.coordinator.data.get(self.sequence)
+        if image_info:
+            self._image_info = image_info
 
         self.async_write_ha_state()
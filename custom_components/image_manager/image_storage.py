@@ -3,27 +3,41 @@
 from __future__ import annotations
 
 import asyncio
+import errno
+from functools import partial
 import hashlib
 import io
 import json
 import logging
 import os
+import shutil
+import struct
 import tempfile
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Dict, List, Optional
 
-from PIL import Image, ImageOps
-import aiofiles
+from PIL import ExifTags, Image, ImageOps
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_bytes
 from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 
 from .const import (
     IMAGES_DIR,
     METADATA_FILE,
     IMAGE_FILE_PATTERN,
     GITKEEP_FILE,
+    UPLOAD_DIR,
+    UPLOAD_FILE_SUFFIX,
     REQUIRED_IMAGE_WIDTH,
     REQUIRED_IMAGE_HEIGHT,
     SUPPORTED_FORMATS,
@@ -38,6 +52,161 @@ from .pdf_to_png import pdf_to_png
 
 _LOGGER = logging.getLogger(__name__)
 
+# PDFium is not thread-safe, so PDFs are converted one at a time across all
+# config entries
+_PDF_LOCK = asyncio.Lock()
+
+# Read size for hashing files that are stored without being loaded
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def _read_bytes(path: Path, size: int = -1) -> bytes:
+    """Read a file, or its first size bytes, in one blocking call."""
+    with open(path, "rb") as f:
+        return f.read(size)
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    """Write a file in one blocking call, for use in the executor."""
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def _write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Write a file via a synced temporary file so it is never left half written."""
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _move_into_place(source: Path, path: Path) -> None:
+    """Rename a file to its final path, copying it across filesystems."""
+    try:
+        os.replace(source, path)
+    except OSError as err:
+        if err.errno != errno.EXDEV:
+            raise
+        shutil.copyfile(source, path)
+
+
+def _place(content: bytes | Path, path: Path) -> None:
+    """Write data to path, or move the file holding it there."""
+    if isinstance(content, bytes):
+        _write_bytes(path, content)
+    else:
+        _move_into_place(content, path)
+
+
+def _fsync_dir(path: Path) -> None:
+    """Flush a directory's entries, so renames into it survive a power loss."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    except OSError as err:
+        # Not every filesystem supports syncing a directory
+        _LOGGER.debug("Failed to sync directory %s: %s", path, err)
+
+
+def _remove_files(paths: List[Path]) -> List[Path]:
+    """Remove files in one blocking call, returning the ones that were removed."""
+    removed = []
+    for path in paths:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            continue
+        except OSError as err:
+            _LOGGER.warning("Failed to delete file %s: %s", path, err)
+            continue
+        _LOGGER.info("Deleted file: %s", path.name)
+        removed.append(path)
+    return removed
+
+
+def _flatten_alpha(img: Image.Image) -> Image.Image:
+    """Blend an image with transparency onto white in one vectorized pass."""
+    rgba = np.asarray(img.convert("RGBA"), dtype=np.uint16)
+    alpha = rgba[..., 3:]
+    rgb = (rgba[..., :3] * alpha + 255 * (255 - alpha) + 127) // 255
+    return Image.fromarray(rgb.astype(np.uint8))
+
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# JPEG start-of-frame markers, which carry the image dimensions
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _fast_dims(data: bytes) -> tuple[str, int, int] | None:
+    """Return (format, width, height) read from a PNG or JPEG header, if possible."""
+    if data[:8] == _PNG_SIGNATURE and data[12:16] == b"IHDR":
+        width, height = struct.unpack(">II", data[16:24])
+        return "PNG", width, height
+
+    if data[:2] != b"\xff\xd8":
+        return None
+
+    # Walk the JPEG segments up to the first start-of-frame marker
+    pos = 2
+    while pos + 9 <= len(data):
+        if data[pos] != 0xFF:
+            return None
+        marker = data[pos + 1]
+        if marker == 0xFF:
+            # Fill byte
+            pos += 1
+            continue
+        if marker in _JPEG_SOF_MARKERS:
+            height, width = struct.unpack(">HH", data[pos + 5 : pos + 9])
+            return "JPEG", width, height
+        if marker == 0xDA:
+            # Start of scan without a frame header
+            return None
+        pos += 2 + struct.unpack(">H", data[pos + 2 : pos + 4])[0]
+    return None
+
+
+def _header_size_ok(fmt: str, width: int, height: int) -> bool:
+    """Return whether an image of this size can decode to the required size."""
+    # JPEGs are decoded in draft mode, so mirror the DCT scale libjpeg picks
+    required = (REQUIRED_IMAGE_WIDTH, REQUIRED_IMAGE_HEIGHT)
+    if (width, height) == required:
+        return True
+    if fmt != "JPEG":
+        return False
+    scale = min(width // REQUIRED_IMAGE_WIDTH, height // REQUIRED_IMAGE_HEIGHT)
+    scale = next((s for s in (8, 4, 2) if scale >= s), 1)
+    return (-(-width // scale), -(-height // scale)) == required
+
+
+def _short_hash(data: bytes) -> str:
+    """Return the short content hash used in stored file names."""
+    return hashlib.blake2b(data, digest_size=4).hexdigest()
+
+
+def _content_hash(content: bytes | Path) -> str:
+    """Return the short content hash of data, or of a file read in chunks."""
+    if isinstance(content, bytes):
+        return _short_hash(content)
+    file_hash = hashlib.blake2b(digest_size=4)
+    with open(content, "rb") as f:
+        while chunk := f.read(_HASH_CHUNK_SIZE):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def _read_if_modified(path: Path, mtime_ns: int | None) -> tuple[int, bytes | None]:
+    """Return the file's mtime and its content if the mtime differs from mtime_ns."""
+    current_mtime_ns = os.stat(path).st_mtime_ns
+    if current_mtime_ns == mtime_ns:
+        return current_mtime_ns, None
+    return current_mtime_ns, _read_bytes(path)
+
 
 class ImageStorageManager:
     """Manages image storage, validation, and rotation."""
@@ -53,7 +222,18 @@ class ImageStorageManager:
         self._storage_path = Path(hass.config.path("image_manager", IMAGES_DIR))
         self._metadata_path = self._storage_path / METADATA_FILE
         self._lock = asyncio.Lock()
-
+        self._metadata_cache: Dict[str, Any] | None = None
+        self._metadata_mtime_ns: int | None = None
+        self._by_sequence: Dict[int, Dict[str, Any]] = {}
+        # Uploads are streamed here before being stored
+        self._upload_path = self._storage_path / UPLOAD_DIR
+
+    async def async_setup(self) -> None:
+        """Create the storage directories and clear interrupted uploads."""
+        await self.hass.async_add_executor_job(self._setup_directories)
+
+    def _setup_directories(self) -> None:
+        """Create the storage directories (runs in executor)."""
         # Ensure storage directory exists
         self._storage_path.mkdir(parents=True, exist_ok=True)
 
@@ -62,145 +242,207 @@ class ImageStorageManager:
         if not gitkeep_path.exists():
             gitkeep_path.touch()
 
-    async def load_metadata(self) -> Dict[str, Any]:
-        """Load metadata from storage."""
-        if not self._metadata_path.exists():
-            return {"images": [], "next_sequence": 1}
+        # Anything left over is from an upload that was interrupted by a restart
+        self._upload_path.mkdir(exist_ok=True)
+        for stale_upload in self._upload_path.glob(f"*{UPLOAD_FILE_SUFFIX}"):
+            stale_upload.unlink(missing_ok=True)
 
+    async def _async_get_metadata(self) -> Dict[str, Any]:
+        """Return cached metadata, re-reading it only when the file has changed."""
         try:
-            async with aiofiles.open(self._metadata_path, "r") as f:
-                content = await f.read()
-                return json.loads(content)
+            mtime_ns, content = await self.hass.async_add_executor_job(
+                _read_if_modified, self._metadata_path, self._metadata_mtime_ns
+            )
+            if content is not None:
+                self._set_metadata_cache(json_loads(content), mtime_ns)
+        except FileNotFoundError:
+            self._set_metadata_cache(None, None)
+            return {"images": [], "next_sequence": 1}
         except (json.JSONDecodeError, OSError) as err:
             _LOGGER.error("Failed to load metadata: %s", err)
+            self._set_metadata_cache(None, None)
             return {"images": [], "next_sequence": 1}
 
+        return self._metadata_cache
+
+    def _set_metadata_cache(
+        self, metadata: Dict[str, Any] | None, mtime_ns: int | None
+    ) -> None:
+        """Cache metadata and rebuild the sequence index from it."""
+        self._metadata_cache, self._metadata_mtime_ns = metadata, mtime_ns
+        self._by_sequence = (
+            {img["sequence"]: img for img in metadata["images"]} if metadata else {}
+        )
+
+    async def load_metadata(self) -> Dict[str, Any]:
+        """Load metadata from storage."""
+        metadata = await self._async_get_metadata()
+        # Callers modify the image list, so hand out a copy of it
+        return {**metadata, "images": list(metadata["images"])}
+
     async def save_metadata(self, metadata: Dict[str, Any]) -> None:
         """Save metadata to storage."""
+        content = json_bytes(metadata)
         try:
-            async with aiofiles.open(self._metadata_path, "w") as f:
-                await f.write(json.dumps(metadata, indent=2))
-        except OSError as err:
-            _LOGGER.error("Failed to save metadata: %s", err)
+            mtime_ns = await self.hass.async_add_executor_job(
+                self._write_metadata, content
+            )
+        except OSError:
+            self._set_metadata_cache(None, None)
             raise
+        self._set_metadata_cache(metadata, mtime_ns)
 
-    async def validate_image(self, image_data: bytes) -> tuple[bool, str | None]:
-        """Validate image data and dimensions."""
-        if len(image_data) > MAX_FILE_SIZE:
-            return False, ERROR_FILE_TOO_LARGE
-
+    def _write_metadata(self, content: bytes) -> int:
+        """Write serialized metadata atomically and return its new mtime."""
         try:
-            # Run PIL operations in executor to avoid blocking
-            def _validate():
-                with Image.open(io.BytesIO(image_data)) as img:
-                    # Check format
-                    if img.format not in SUPPORTED_FORMATS:
-                        return False, ERROR_UNSUPPORTED_FORMAT
-
-                    # Check dimensions
-                    if img.size != (REQUIRED_IMAGE_WIDTH, REQUIRED_IMAGE_HEIGHT):
-                        return False, ERROR_INVALID_DIMENSIONS
-
-                    return True, None
-
-            import io
+            _write_bytes_atomic(self._metadata_path, content)
+            return os.stat(self._metadata_path).st_mtime_ns
+        except OSError as err:
+            _LOGGER.error("Failed to save metadata: %s", err)
+            raise
 
-            return await self.hass.async_add_executor_job(_validate)
+    def open_upload_file(self) -> tuple[Path, BinaryIO]:
+        """Create a temporary file to stream an upload into (runs in executor)."""
+        fd, name = tempfile.mkstemp(suffix=UPLOAD_FILE_SUFFIX, dir=self._upload_path)
+        # mkstemp creates the file private; it may be moved into storage as is
+        os.fchmod(fd, 0o644)
+        return Path(name), os.fdopen(fd, "wb")
+
+    def _file_paths(self, image_info: Dict[str, Any]) -> List[Path]:
+        """Return the image file path and, if present, the PDF file path."""
+        paths = [self._storage_path / image_info["filename"]]
+        if image_info.get("pdf_filename"):
+            paths.append(self._storage_path / image_info["pdf_filename"])
+        return paths
+
+    async def validate_and_process_image(
+        self, image: bytes | Path
+    ) -> tuple[bool, str | None, bytes | None]:
+        """Validate image data or an image file and its dimensions, then process it."""
+        # A file that can be stored as it is comes back with None as its data
+        if isinstance(image, bytes):
+            if len(image) > MAX_FILE_SIZE:
+                return False, ERROR_FILE_TOO_LARGE, None
+
+            # Reject PNGs and JPEGs of the wrong size from their header alone,
+            # without a trip to the executor
+            header = _fast_dims(image)
+            if header is not None and not _header_size_ok(*header):
+                return False, ERROR_INVALID_DIMENSIONS, None
+
+        def _validate_and_process():
+            if isinstance(image, bytes):
+                source = io.BytesIO(image)
+            elif image.stat().st_size > MAX_FILE_SIZE:
+                return False, ERROR_FILE_TOO_LARGE, None
+            else:
+                # Pillow reads only the header until the pixels are needed
+                source = image
 
-        except Exception as err:
-            _LOGGER.error("Failed to validate image: %s", err)
-            return False, ERROR_UNSUPPORTED_FORMAT
-
-    async def process_image(self, image_data: bytes) -> bytes:
-        """Process image data (convert to JPEG if needed)."""
-
-        def _process():
-            import io
-
-            with Image.open(io.BytesIO(image_data)) as img:
-                # Convert to RGB if needed (for PNG with transparency)
-                if img.mode in ("RGBA", "LA", "P"):
-                    # Create white background
-                    background = Image.new("RGB", img.size, (255, 255, 255))
-                    if img.mode == "P":
-                        img = img.convert("RGBA")
-                    background.paste(
-                        img,
-                        mask=img.split()[-1] if img.mode in ("RGBA", "LA") else None,
-                    )
-                    img = background
-                elif img.mode != "RGB":
-                    img = img.convert("RGB")
-
-                # Apply EXIF orientation
-                img = ImageOps.exif_transpose(img)
-
-                # Save as JPEG
-                output = io.BytesIO()
-                img.save(
-                    output, format=OUTPUT_FORMAT, quality=JPEG_QUALITY, optimize=True
-                )
-                return output.getvalue()
-
-        return await self.hass.async_add_executor_job(_process)
+            try:
+                img = Image.open(source)
+            except Exception as err:
+                _LOGGER.error("Failed to validate image: %s", err)
+                return False, ERROR_UNSUPPORTED_FORMAT, None
+
+            with img:
+                # Check format
+                if img.format not in SUPPORTED_FORMATS:
+                    return False, ERROR_UNSUPPORTED_FORMAT, None
+
+                # Let libjpeg decode oversized JPEGs at a reduced DCT scale
+                # (1/2, 1/4 or 1/8); this is a no-op for other formats
+                img.draft("RGB", (REQUIRED_IMAGE_WIDTH, REQUIRED_IMAGE_HEIGHT))
+
+                # Check dimensions
+                if img.size != (REQUIRED_IMAGE_WIDTH, REQUIRED_IMAGE_HEIGHT):
+                    return False, ERROR_INVALID_DIMENSIONS, None
+
+                processed_data = self._process_image(img)
+                if processed_data is None and isinstance(image, bytes):
+                    processed_data = image
+                return True, None, processed_data
+
+        return await self.hass.async_add_executor_job(_validate_and_process)
+
+    def _process_image(self, img: Image.Image) -> bytes | None:
+        """Convert a decoded image to the output format, or return None if it is."""
+        # Already in the output format with nothing to convert or rotate
+        if (
+            img.format == OUTPUT_FORMAT
+            and img.mode == "RGB"
+            and img.getexif().get(ExifTags.Base.Orientation, 1) == 1
+        ):
+            return None
+
+        # Convert to RGB if needed (for PNG with transparency)
+        if img.mode in ("RGBA", "LA", "P") and NUMPY_AVAILABLE:
+            img = _flatten_alpha(img)
+        elif img.mode in ("RGBA", "LA", "P"):
+            # Create white background
+            background = Image.new("RGB", img.size, (255, 255, 255))
+            if img.mode == "P":
+                img = img.convert("RGBA")
+            background.paste(
+                img,
+                mask=img.split()[-1] if img.mode in ("RGBA", "LA") else None,
+            )
+            img = background
+        elif img.mode != "RGB":
+            img = img.convert("RGB")
+
+        # Apply EXIF orientation
+        img = ImageOps.exif_transpose(img)
+
+        # Save in the output format. PNG's optimize flag forces zlib level 9,
+        # so match the fast compression the PDF renderer uses instead.
+        output = io.BytesIO()
+        img.save(
+            output,
+            format=OUTPUT_FORMAT,
+            quality=JPEG_QUALITY,
+            optimize=False,
+            compress_level=1,
+        )
+        return output.getvalue()
 
     def _is_pdf_file(self, file_data: bytes) -> bool:
         """Check if the file data is a PDF file."""
         # PDF files start with %PDF
         return file_data.startswith(b"%PDF")
 
-    async def _convert_pdf_to_png(self, pdf_data: bytes) -> bytes:
-        """Convert PDF data to PNG image data."""
+    async def _convert_pdf_to_png(self, pdf: bytes | Path) -> bytes:
+        """Convert a PDF, given as data or as a file path, to PNG image data."""
 
         def _convert():
-            # Create temporary files for PDF input and PNG output
-            with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as pdf_temp:
-                pdf_temp.write(pdf_data)
-                pdf_temp.flush()
-
-                with tempfile.NamedTemporaryFile(
-                    suffix=".png", delete=False
-                ) as png_temp:
-                    try:
-                        # Convert PDF to PNG using the pdf_to_png function
-                        pdf_to_png(
-                            pdf_path=pdf_temp.name,
-                            output_path=png_temp.name,
-                            target_width=REQUIRED_IMAGE_WIDTH,
-                            target_height=REQUIRED_IMAGE_HEIGHT,
-                        )
-
-                        # Read the converted PNG data
-                        with open(png_temp.name, "rb") as f:
-                            png_data = f.read()
-
-                        return png_data
-
-                    finally:
-                        # Clean up temporary files
-                        try:
-                            os.unlink(pdf_temp.name)
-                        except OSError:
-                            pass
-                        try:
-                            os.unlink(png_temp.name)
-                        except OSError:
-                            pass
+            # Render into an in-memory PNG buffer; PDFium reads a file itself
+            output = io.BytesIO()
+            pdf_to_png(
+                pdf=pdf if isinstance(pdf, bytes) else str(pdf),
+                output=output,
+                target_width=REQUIRED_IMAGE_WIDTH,
+                target_height=REQUIRED_IMAGE_HEIGHT,
+            )
+            return output.getvalue()
 
-        return await self.hass.async_add_executor_job(_convert)
+        try:
+            _LOGGER.info("PDF file detected, converting to PNG")
+            async with _PDF_LOCK:
+                png_data = await self.hass.async_add_executor_job(_convert)
+            _LOGGER.info("PDF successfully converted to PNG")
+            return png_data
+        except Exception as err:
+            _LOGGER.error("Failed to convert PDF to PNG: %s", err)
+            raise ValueError(f"Failed to convert PDF to image: {err}")
 
     def _generate_filename(
         self,
         sequence: int,
         timestamp: int,
-        image_data: bytes,
+        file_hash: str,
         filename: Optional[str] = None,
     ) -> str:
         """Generate filename for image."""
-        # Create hash of image data
-        hash_obj = hashlib.md5(image_data)
-        file_hash = hash_obj.hexdigest()[:8]
-
         return IMAGE_FILE_PATTERN.format(
             sequence=sequence,
             timestamp=timestamp,
@@ -212,46 +454,75 @@ class ImageStorageManager:
         self,
         sequence: int,
         timestamp: int,
-        pdf_data: bytes,
+        file_hash: str,
         filename: Optional[str] = None,
     ) -> str:
         """Generate filename for PDF."""
-        # Create hash of PDF data
-        hash_obj = hashlib.md5(pdf_data)
-        file_hash = hash_obj.hexdigest()[:8]
-
         return f"image_{sequence}_{timestamp}_{file_hash}_{filename if filename else 'doc'}.pdf"
 
     async def store_image(
         self, image_data: bytes, filename: Optional[str] = None
-    ) -> Dict[str, Any]:
+    ) -> tuple[Dict[str, Any], Optional[int]]:
         """Store image with automatic rotation if needed. Converts PDF files to PNG."""
-        async with self._lock:
-            pdf_data: bytes | None = None
-            pdf_filename = None
-
-            # Check if the uploaded file is a PDF
-            if self._is_pdf_file(image_data):
-                try:
-                    _LOGGER.info("PDF file detected, converting to PNG")
-                    # Save original PDF data
-                    pdf_data = image_data
-
-                    # Convert PDF to PNG
-                    image_data = await self._convert_pdf_to_png(image_data)
-                    _LOGGER.info("PDF successfully converted to PNG")
-                except Exception as err:
-                    _LOGGER.error("Failed to convert PDF to PNG: %s", err)
-                    raise ValueError(f"Failed to convert PDF to image: {err}")
-
-            # Validate image
-            is_valid, error = await self.validate_image(image_data)
+        # Check if the uploaded file is a PDF. The converter already renders
+        # an RGB PNG at the required size, so it is stored as produced rather
+        # than decoded again for validation and processing.
+        if self._is_pdf_file(image_data):
+            png_data = await self._convert_pdf_to_png(image_data)
+            return await self._async_store(png_data, filename, image_data)
+
+        # Validate and process image
+        is_valid, error, processed_data = await self.validate_and_process_image(
+            image_data
+        )
+        if not is_valid:
+            raise ValueError(f"Invalid image: {error}")
+        return await self._async_store(processed_data, filename)
+
+    async def store_image_file(
+        self, upload_path: Path, filename: Optional[str] = None
+    ) -> tuple[Dict[str, Any], Optional[int]]:
+        """Store an upload that was streamed to a temporary file, then remove it."""
+        # The file is decoded from disk and moved into place when kept as is
+        try:
+            header = await self.hass.async_add_executor_job(_read_bytes, upload_path, 8)
+            if self._is_pdf_file(header):
+                png_data = await self._convert_pdf_to_png(upload_path)
+                return await self._async_store(png_data, filename, upload_path)
+
+            (
+                is_valid,
+                error,
+                processed_data,
+            ) = await self.validate_and_process_image(upload_path)
             if not is_valid:
                 raise ValueError(f"Invalid image: {error}")
+            return await self._async_store(processed_data or upload_path, filename)
+        finally:
+            await self.hass.async_add_executor_job(
+                partial(upload_path.unlink, missing_ok=True)
+            )
 
-            # Process image
-            processed_data = await self.process_image(image_data)
-
+    async def _async_store(
+        self,
+        image: bytes | Path,
+        filename: Optional[str],
+        pdf: bytes | Path | None = None,
+    ) -> tuple[Dict[str, Any], Optional[int]]:
+        """Save an image and its source PDF, given as data or files, under the lock."""
+
+        def _hash_and_size() -> tuple[str, int]:
+            # The image rendered from a PDF is derived from it, so both files
+            # share the hash of the PDF
+            file_hash = _content_hash(image if pdf is None else pdf)
+            size = len(image) if isinstance(image, bytes) else image.stat().st_size
+            return file_hash, size
+
+        file_hash, size = await self.hass.async_add_executor_job(_hash_and_size)
+
+        # Converting, validating and hashing can run alongside other uploads
+        # and deletes; only the metadata update and file changes need the lock
+        async with self._lock:
             # Load current metadata
             metadata = await self.load_metadata()
             images = metadata["images"]
@@ -260,67 +531,27 @@ class ImageStorageManager:
             # Generate filename
             timestamp = int(time.time())
             filename = self._generate_filename(
-                next_sequence, timestamp, processed_data, filename
+                next_sequence, timestamp, file_hash, filename
             )
-
-            if pdf_data:
+            pdf_filename = None
+            if pdf is not None:
                 pdf_filename = self._generate_pdf_filename(
-                    next_sequence, timestamp, pdf_data, filename
+                    next_sequence, timestamp, file_hash, filename
                 )
 
             # Check if we need to rotate (remove oldest)
             _LOGGER.info(
                 "Current images count: %d, max_images: %d", len(images), self.max_images
             )
+            old_paths = []
+            rotated_sequence = None
             if len(images) >= self.max_images:
                 oldest_image = images.pop(0)
-                old_path = self._storage_path / oldest_image["filename"]
-                try:
-                    if old_path.exists():
-                        old_path.unlink()
-                        _LOGGER.info(
-                            "Removed oldest image: %s", oldest_image["filename"]
-                        )
-                except OSError as err:
-                    _LOGGER.warning("Failed to remove old image %s: %s", old_path, err)
+                old_paths = self._file_paths(oldest_image)
+                rotated_sequence = oldest_image["sequence"]
 
-                # Remove associated PDF if exists
-                if "pdf_filename" in oldest_image and oldest_image["pdf_filename"]:
-                    old_pdf_path = self._storage_path / oldest_image["pdf_filename"]
-                    try:
-                        if old_pdf_path.exists():
-                            old_pdf_path.unlink()
-                            _LOGGER.info(
-                                "Removed oldest PDF: %s", oldest_image["pdf_filename"]
-                            )
-                    except OSError as err:
-                        _LOGGER.warning(
-                            "Failed to remove old PDF %s: %s", old_pdf_path, err
-                        )
-
-            # Save new image
             file_path = self._storage_path / filename
-            try:
-                async with aiofiles.open(file_path, "wb") as f:
-                    await f.write(processed_data)
-            except OSError as err:
-                _LOGGER.error("Failed to save image %s: %s", filename, err)
-                raise
-
-            # Save PDF if exists
-            if pdf_filename and pdf_data:
-                pdf_path = self._storage_path / pdf_filename
-                try:
-                    async with aiofiles.open(pdf_path, "wb") as f:
-                        await f.write(pdf_data)
-                except OSError as err:
-                    _LOGGER.error("Failed to save PDF %s: %s", pdf_filename, err)
-                    # Try to cleanup image file
-                    try:
-                        file_path.unlink()
-                    except OSError:
-                        pass
-                    raise
+            pdf_path = self._storage_path / pdf_filename if pdf_filename else None
 
             # Create image metadata
             image_info = {
@@ -328,7 +559,7 @@ class ImageStorageManager:
                 "filename": filename,
                 "timestamp": timestamp,
                 "created_at": dt_util.utcnow().isoformat(),
-                "size": len(processed_data),
+                "size": size,
                 "width": REQUIRED_IMAGE_WIDTH,
                 "height": REQUIRED_IMAGE_HEIGHT,
             }
@@ -340,47 +571,62 @@ class ImageStorageManager:
             images.append(image_info)
             metadata["images"] = images
             metadata["next_sequence"] = next_sequence + 1
+            content = json_bytes(metadata)
 
-            # Save metadata
-            await self.save_metadata(metadata)
+            def _persist() -> int:
+                # Remove rotated files, save the new ones and the metadata
+                _remove_files(old_paths)
+
+                try:
+                    _place(image, file_path)
+                except OSError as err:
+                    _LOGGER.error("Failed to save image %s: %s", filename, err)
+                    raise
+
+                if pdf_path is not None:
+                    try:
+                        _place(pdf, pdf_path)
+                    except OSError as err:
+                        _LOGGER.error("Failed to save PDF %s: %s", pdf_filename, err)
+                        # Try to cleanup image file
+                        try:
+                            file_path.unlink()
+                        except OSError:
+                            pass
+                        raise
+
+                mtime_ns = self._write_metadata(content)
+                _fsync_dir(self._storage_path)
+                return mtime_ns
+
+            try:
+                mtime_ns = await self.hass.async_add_executor_job(_persist)
+            except OSError:
+                self._set_metadata_cache(None, None)
+                raise
+            self._set_metadata_cache(metadata, mtime_ns)
 
             _LOGGER.info("Stored image: %s (sequence: %d)", filename, next_sequence)
-            return image_info
+            return image_info, rotated_sequence
 
     async def delete_image(self, sequence: int) -> bool:
         """Delete image by sequence number."""
         async with self._lock:
             metadata = await self.load_metadata()
-            images = metadata["images"]
 
             # Find image by sequence
-            image_to_delete = None
-            for i, img in enumerate(images):
-                if img["sequence"] == sequence:
-                    image_to_delete = images.pop(i)
-                    break
-
+            image_to_delete = self._by_sequence.get(sequence)
             if not image_to_delete:
                 return False
 
-            # Delete file
-            file_path = self._storage_path / image_to_delete["filename"]
-            try:
-                if file_path.exists():
-                    file_path.unlink()
-                    _LOGGER.info("Deleted image: %s", image_to_delete["filename"])
-            except OSError as err:
-                _LOGGER.warning("Failed to delete image file %s: %s", file_path, err)
-
-            # Delete PDF file if exists
-            if "pdf_filename" in image_to_delete and image_to_delete["pdf_filename"]:
-                pdf_path = self._storage_path / image_to_delete["pdf_filename"]
-                try:
-                    if pdf_path.exists():
-                        pdf_path.unlink()
-                        _LOGGER.info("Deleted PDF: %s", image_to_delete["pdf_filename"])
-                except OSError as err:
-                    _LOGGER.warning("Failed to delete PDF file %s: %s", pdf_path, err)
+            metadata["images"] = [
+                img for img in metadata["images"] if img is not image_to_delete
+            ]
+
+            # Delete image and PDF files
+            await self.hass.async_add_executor_job(
+                _remove_files, self._file_paths(image_to_delete)
+            )
 
             # Save updated metadata
             await self.save_metadata(metadata)
@@ -391,32 +637,17 @@ class ImageStorageManager:
         async with self._lock:
             metadata = await self.load_metadata()
             images = metadata["images"]
-            deleted_count = 0
-
-            # Delete all image files
-            for img in images:
-                file_path = self._storage_path / img["filename"]
-                try:
-                    if file_path.exists():
-                        file_path.unlink()
-                        deleted_count += 1
-                        _LOGGER.info("Deleted image: %s", img["filename"])
-                except OSError as err:
-                    _LOGGER.warning(
-                        "Failed to delete image file %s: %s", file_path, err
-                    )
 
-                # Delete PDF file if exists
-                if "pdf_filename" in img and img["pdf_filename"]:
-                    pdf_path = self._storage_path / img["pdf_filename"]
-                    try:
-                        if pdf_path.exists():
-                            pdf_path.unlink()
-                            _LOGGER.info("Deleted PDF: %s", img["pdf_filename"])
-                    except OSError as err:
-                        _LOGGER.warning(
-                            "Failed to delete PDF file %s: %s", pdf_path, err
-                        )
+            # Delete all image and PDF files in one executor job
+            removed = set(
+                await self.hass.async_add_executor_job(
+                    _remove_files,
+                    [path for img in images for path in self._file_paths(img)],
+                )
+            )
+            deleted_count = sum(
+                self._storage_path / img["filename"] in removed for img in images
+            )
 
             # Reset metadata
             metadata = {"images": [], "next_sequence": 1}
@@ -425,23 +656,55 @@ class ImageStorageManager:
             _LOGGER.info("Deleted %d images", deleted_count)
             return deleted_count
 
+    async def trim_images(self, max_images: int) -> int:
+        """Delete the oldest images beyond max_images and return how many."""
+        async with self._lock:
+            metadata = await self.load_metadata()
+            images = metadata["images"]
+            excess_count = len(images) - max_images
+            if excess_count <= 0:
+                return 0
+
+            _LOGGER.info(
+                "Cleaning up %d excess images (max_images reduced to %d)",
+                excess_count,
+                max_images,
+            )
+            old_paths = [
+                path for img in images[:excess_count] for path in self._file_paths(img)
+            ]
+            metadata["images"] = images[excess_count:]
+            content = json_bytes(metadata)
+
+            def _persist() -> int:
+                # Remove the excess image and PDF files, then save the metadata
+                _remove_files(old_paths)
+                return self._write_metadata(content)
+
+            try:
+                mtime_ns = await self.hass.async_add_executor_job(_persist)
+            except OSError:
+                self._set_metadata_cache(None, None)
+                raise
+            self._set_metadata_cache(metadata, mtime_ns)
+
+            _LOGGER.info("Cleaned up %d excess images", excess_count)
+            return excess_count
+
     async def get_images(self) -> List[Dict[str, Any]]:
         """Get list of all stored images."""
-        metadata = await self.load_metadata()
+        metadata = await self._async_get_metadata()
         return metadata["images"]
 
     async def get_image_path(self, sequence: int) -> Optional[Path]:
         """Get file path for image by sequence number."""
-        metadata = await self.load_metadata()
-        for img in metadata["images"]:
-            if img["sequence"] == sequence:
-                return self._storage_path / img["filename"]
-        return None
+        await self._async_get_metadata()
+        try:
+            return self._storage_path / self._by_sequence[sequence]["filename"]
+        except KeyError:
+            return None
 
     async def get_image_info(self, sequence: int) -> Optional[Dict[str, Any]]:
         """Get image info by sequence number."""
-        metadata = await self.load_metadata()
-        for img in metadata["images"]:
-            if img["sequence"] == sequence:
-                return img
-        return None
+        await self._async_get_metadata()
+        return self._by_sequence.get(sequence)
@@ -8,8 +8,16 @@ Pure Python implementation using pypdfium2.
 import argparse
 import io
 from pathlib import Path
+from typing import BinaryIO, Union
 from PIL import Image
 
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 try:
     import pypdfium2 as pdfium
 
@@ -17,16 +25,21 @@ try:
 except ImportError:
     PYPDFIUM2_AVAILABLE = False
 
+_LANCZOS = Image.Resampling.LANCZOS
+
 
 def pdf_to_png(
-    pdf_path: str, output_path: str, target_width: int = 3840, target_height: int = 2160
+    pdf: Union[str, bytes, BinaryIO],
+    output: Union[str, BinaryIO],
+    target_width: int = 3840,
+    target_height: int = 2160,
 ):
     """
     Convert PDF to PNG with all pages side by side.
 
     Args:
-        pdf_path: Path to input PDF file
-        output_path: Path for output PNG file
+        pdf: Path to input PDF file, or the PDF content as bytes or a file object
+        output: Path for output PNG file, or a binary file object to write to
         target_width: Target width of output PNG (default: 3840)
         target_height: Target height of output PNG (default: 2160)
     """
@@ -37,42 +50,92 @@ def pdf_to_png(
 
     try:
         # Open PDF document
-        pdf = pdfium.PdfDocument(pdf_path)
-        num_pages = len(pdf)
+        pdf_doc = pdfium.PdfDocument(pdf)
+        num_pages = len(pdf_doc)
 
         if num_pages == 0:
             raise ValueError("PDF has no pages")
 
-        # Render each page to PIL Image (from last to first for right-to-left sequence)
-        page_images = []
-        for page_index in range(num_pages - 1, -1, -1):  # Reverse order: last to first
-            page = pdf.get_page(page_index)
+        # Open pages from last to first for right-to-left sequence
+        pages = [pdf_doc.get_page(i) for i in range(num_pages - 1, -1, -1)]
+
+        # Render at exactly the scale the final layout needs, so pages come out
+        # at their output size and do not need a second resampling pass
+        page_sizes = [page.get_size() for page in pages]
+        scale = _fit_scale(page_sizes, target_width, target_height)
+
+        # Render each page to PIL Image.
+        # PDFium is not thread-safe, so pages are rendered one at a time.
+        # Rendering straight to RGBX lets to_pil() wrap the bitmap buffer
+        # without a copy, so the bitmaps must stay open until the pages have
+        # been pasted into the output canvas.
+        bitmaps = []
+        try:
+            for page in pages:
+                # Render page to bitmap
+                bitmap = page.render(
+                    scale=scale, rotation=0, rev_byteorder=True, prefer_bgrx=True
+                )
+                bitmaps.append(bitmap)
+
+                # Clean up
+                page.close()
+
+            pdf_doc.close()
+
+            # Create combined image
+            page_images = [bitmap.to_pil() for bitmap in bitmaps]
+            _create_combined_image(page_images, output, target_width, target_height)
+        finally:
+            for bitmap in bitmaps:
+                bitmap.close()
 
-            # Calculate scale to get high quality rendering
-            # Start with a reasonable DPI (150-300)
-            scale = 2.0  # This gives roughly 144 DPI for typical PDFs
+    except Exception as e:
+        raise ValueError(f"Failed to process PDF: {e}")
 
-            # Render page to bitmap
-            bitmap = page.render(scale=scale, rotation=0)
 
-            # Convert bitmap to PIL Image
-            pil_image = bitmap.to_pil()
-            page_images.append(pil_image)
+def _fit_scale(page_sizes, target_width: int, target_height: int) -> float:
+    """Return the uniform scale that fits all pages side by side in the target."""
+    page_area_width = target_width / len(page_sizes)
+    max_page_width = max(width for width, _ in page_sizes)
+    max_page_height = max(height for _, height in page_sizes)
+    return min(page_area_width / max_page_width, target_height / max_page_height)
 
-            # Clean up
-            page.close()
 
-        pdf.close()
+def _resize_to(img, size):
+    """Resize an image with LANCZOS unless it is already within a pixel of size."""
+    if abs(img.width - size[0]) <= 1 and abs(img.height - size[1]) <= 1:
+        # The renderer may round up a pixel; crop so size is never exceeded
+        if img.width > size[0] or img.height > size[1]:
+            return img.crop((0, 0, min(img.width, size[0]), min(img.height, size[1])))
+        return img
+    return img.resize(size, _LANCZOS)
 
-        # Create combined image
-        _create_combined_image(page_images, output_path, target_width, target_height)
 
-    except Exception as e:
-        raise ValueError(f"Failed to process PDF: {e}")
+def _compose(placements, target_width: int, target_height: int):
+    """Draw (image, x, y) placements onto a white RGB canvas."""
+    if not NUMPY_AVAILABLE:
+        output_img = Image.new("RGB", (target_width, target_height), "white")
+        for img, x, y in placements:
+            output_img.paste(img, (x, y))
+        return output_img
+
+    canvas = np.full((target_height, target_width, 3), 255, dtype=np.uint8)
+    for img, x, y in placements:
+        # Clip to the canvas like Image.paste does, so a page that rounds a
+        # pixel past the edge cannot fail the assignment
+        x0, y0 = max(x, 0), max(y, 0)
+        x1 = min(x + img.width, target_width)
+        y1 = min(y + img.height, target_height)
+        if x0 >= x1 or y0 >= y1:
+            continue
+        # Rendered pages may still be RGBX; the padding byte is dropped here
+        canvas[y0:y1, x0:x1] = np.asarray(img)[y0 - y : y1 - y, x0 - x : x1 - x, :3]
+    return Image.fromarray(canvas)
 
 
 def _create_combined_image(
-    page_images, output_path: str, target_width: int, target_height: int
+    page_images, output: Union[str, BinaryIO], target_width: int, target_height: int
 ):
     """Create a combined image from multiple page images."""
     num_pages = len(page_images)
@@ -90,13 +153,12 @@ def _create_combined_image(
         new_height = int(page_img.height * scale)
 
         # Resize the image
-        resized_img = page_img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        resized_img = _resize_to(page_img, (new_width, new_height))
 
-        # Create output canvas and center the image
-        output_img = Image.new("RGB", (target_width, target_height), "white")
-        x_offset = (target_width - new_width) // 2
-        y_offset = (target_height - new_height) // 2
-        output_img.paste(resized_img, (x_offset, y_offset))
+        # Center the image on the output canvas
+        x_offset = (target_width - resized_img.width) // 2
+        y_offset = (target_height - resized_img.height) // 2
+        placements = [(resized_img, x_offset, y_offset)]
 
     else:
         # Multiple pages - arrange side by side
@@ -116,23 +178,17 @@ def _create_combined_image(
         scale = min(scale_width, scale_height)  # * 0.9  # Leave some padding
 
         # Resize pages maintaining aspect ratio
-        scaled_images = []
-        scaled_max_height = 0
-
-        for img in page_images:
-            new_width = int(img.width * scale)
-            new_height = int(img.height * scale)
-            scaled_img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            scaled_images.append(scaled_img)
-            scaled_max_height = max(scaled_max_height, new_height)
-
-        # Create output canvas
-        output_img = Image.new("RGB", (target_width, target_height), "white")
+        scaled_images = [
+            _resize_to(img, (int(img.width * scale), int(img.height * scale)))
+            for img in page_images
+        ]
+        scaled_max_height = max(img.height for img in scaled_images)
 
         # Calculate vertical centering offset
         v_offset = (target_height - scaled_max_height) // 2
 
-        # Paste pages with equal distribution across width
+        # Place pages with equal distribution across width
+        placements = []
         for i, scaled_img in enumerate(scaled_images):
             # Calculate x position: left margin + (page_index * (page_area + margin))
             page_center_x = (
@@ -144,13 +200,12 @@ def _create_combined_image(
 
             # Center each page vertically
             page_v_offset = v_offset + (scaled_max_height - scaled_img.height) // 2
-            output_img.paste(scaled_img, (page_x, page_v_offset))
+            placements.append((scaled_img, page_x, page_v_offset))
+
+    output_img = _compose(placements, target_width, target_height)
 
     # Save with high quality
-    output_img.save(output_path, "PNG", optimize=False, compress_level=1)
-    print(f"Successfully converted PDF to {output_path}")
-    print(f"Output dimensions: {target_width}x{target_height}")
-    print(f"Pages processed: {num_pages}")
+    output_img.save(output, "PNG", optimize=False, compress_level=1)
 
 
 if __name__ == "__main__":
@@ -166,3 +221,5 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
     pdf_to_png(args.pdf_path, args.output_path, args.width, args.height)
+    print(f"Successfully converted PDF to {args.output_path}")
+    print(f"Output dimensions: {args.width}x{args.height}")
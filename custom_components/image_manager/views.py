@@ -2,16 +2,23 @@
 
 from __future__ import annotations
 
+from email.utils import formatdate
+from functools import partial
 import json
 import logging
+import math
+import os
 from pathlib import Path
-from typing import Any
+from stat import S_ISREG
+from typing import Any, BinaryIO
 
-from aiohttp import web
+from aiohttp import BodyPartReader, web
+from aiohttp.helpers import ETAG_ANY
 from aiohttp.web_exceptions import HTTPBadRequest, HTTPNotFound
 
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_bytes
 
 from .const import (
     API_ENDPOINT,
@@ -23,6 +30,251 @@ from .coordinator import ImageManagerCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Read size for files served without sendfile (e.g. behind TLS). PDFs can be
+# many megabytes, so they are read in steps matching the kernel's readahead.
+FILE_CHUNK_SIZE = 256 * 1024
+PDF_CHUNK_SIZE = 1024 * 1024
+# Read size for streaming uploaded files to disk, and how much of it is
+# gathered before each write so the executor is not used for every chunk
+UPLOAD_CHUNK_SIZE = 64 * 1024
+UPLOAD_WRITE_SIZE = 1024 * 1024
+
+# Fixed response bodies, serialized once
+_NOT_MULTIPART_BODY = json_bytes({"error": "Content-Type must be multipart/form-data"})
+_TOO_LARGE_BODY = json_bytes(
+    {"error": f"File too large. Maximum size is {MAX_FILE_SIZE // (1024 * 1024)}MB"}
+)
+_NO_IMAGE_BODY = json_bytes({"error": "No image data provided"})
+_NO_SEQUENCE_BODY = json_bytes({"error": "Sequence number required"})
+_NOT_FOUND_BODY = json_bytes({"error": "Image not found"})
+_SUCCESS_BODY = json_bytes({"success": True})
+
+
+def _json_body_response(body: bytes, status: int = 200) -> web.Response:
+    """Return a JSON response for an already serialized body."""
+    return web.Response(body=body, status=status, content_type="application/json")
+
+
+class StoredFileResponse(web.FileResponse):
+    """FileResponse for stored images and PDFs, reusing the view's stat result."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        stat_result: os.stat_result | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the response."""
+        super().__init__(path, **kwargs)
+        self._stat_result = stat_result
+
+    def _get_file_path_stat_encoding(
+        self, accept_encoding: str
+    ) -> tuple[Path | None, os.stat_result, str | None]:
+        # Stored files never have pre-compressed .gz/.br siblings to look up
+        st = self._stat_result or self._path.stat()
+        return (self._path if S_ISREG(st.st_mode) else None), st, None
+
+
+def _file_etag(st: os.stat_result) -> str:
+    """Return the ETag value for a file, in the format aiohttp uses."""
+    return f"{st.st_mtime_ns:x}-{st.st_size:x}"
+
+
+def _cache_headers(st: os.stat_result) -> dict[str, str]:
+    """Return the caching and validator headers for a served file."""
+    return {
+        "Cache-Control": "public, max-age=3600",
+        "ETag": f'"{_file_etag(st)}"',
+        # Rounded up like FileResponse does, so 304s match the 200's header
+        "Last-Modified": formatdate(math.ceil(st.st_mtime), usegmt=True),
+    }
+
+
+def _etag_matches(request: web.Request, etag_value: str) -> bool:
+    """Return whether the request's If-None-Match header matches an ETag value."""
+    return any(
+        etag.value in (etag_value, ETAG_ANY) for etag in request.if_none_match or ()
+    )
+
+
+def _is_not_modified(request: web.Request, st: os.stat_result) -> bool:
+    """Return whether the client's cached copy of the file is still current."""
+    if request.if_none_match is not None:
+        return _etag_matches(request, _file_etag(st))
+    if_modified_since = request.if_modified_since
+    return (
+        if_modified_since is not None and st.st_mtime <= if_modified_since.timestamp()
+    )
+
+
+def _discard_upload(file: BinaryIO, path: Path) -> None:
+    """Close and remove a partially received upload."""
+    file.close()
+    path.unlink(missing_ok=True)
+
+
+async def _async_receive_file(
+    coordinator: ImageManagerCoordinator, field: BodyPartReader
+) -> tuple[Path | None, int]:
+    """Stream a multipart file field to a temporary file and return it and its size."""
+    # The path is None if the field was empty or exceeded MAX_FILE_SIZE
+    hass = coordinator.hass
+    path, file = await hass.async_add_executor_job(
+        coordinator.storage_manager.open_upload_file
+    )
+    size = 0
+    buffer = bytearray()
+    try:
+        while chunk := await field.read_chunk(UPLOAD_CHUNK_SIZE):
+            size += len(chunk)
+            if size > MAX_FILE_SIZE:
+                break
+            buffer += chunk
+            if len(buffer) >= UPLOAD_WRITE_SIZE:
+                await hass.async_add_executor_job(file.write, buffer)
+                buffer.clear()
+        if buffer and size <= MAX_FILE_SIZE:
+            await hass.async_add_executor_job(file.write, buffer)
+    except BaseException:
+        await hass.async_add_executor_job(_discard_upload, file, path)
+        raise
+
+    if not size or size > MAX_FILE_SIZE:
+        await hass.async_add_executor_job(_discard_upload, file, path)
+        return None, size
+
+    await hass.async_add_executor_job(file.close)
+    return path, size
+
+
+async def _async_receive_upload(
+    coordinator: ImageManagerCoordinator, request: web.Request
+) -> tuple[Path | None, str | None, int]:
+    """Read an upload form and return its streamed image file, filename and size."""
+    reader = await request.multipart()
+    upload_path = None
+    filename = None
+    size = 0
+
+    try:
+        async for field in reader:
+            if field.name == "image":
+                if upload_path:
+                    await coordinator.hass.async_add_executor_job(
+                        partial(upload_path.unlink, missing_ok=True)
+                    )
+                upload_path, size = await _async_receive_file(coordinator, field)
+                filename = field.filename
+                if size > MAX_FILE_SIZE:
+                    break
+            elif field.name == "filename":
+                filename = await field.text()
+    except BaseException:
+        if upload_path:
+            await coordinator.hass.async_add_executor_job(
+                partial(upload_path.unlink, missing_ok=True)
+            )
+        raise
+
+    return upload_path, filename, size
+
+
+def _status_response(
+    coordinator: ImageManagerCoordinator, request: web.Request
+) -> web.Response:
+    """Return the coordinator's cached status payload, or 304 if unchanged."""
+    try:
+        body, etag_value = coordinator.get_status_bytes()
+    except Exception as err:
+        _LOGGER.error("Failed to get status: %s", err)
+        return HomeAssistantView.json({"error": str(err)}, status_code=500)
+
+    headers = {"Cache-Control": "no-cache", "ETag": f'"{etag_value}"'}
+    if _etag_matches(request, etag_value):
+        return web.Response(status=304, headers=headers)
+    return web.Response(body=body, content_type="application/json", headers=headers)
+
+
+async def _handle_upload(
+    coordinator: ImageManagerCoordinator, request: web.Request
+) -> web.Response:
+    """Handle image upload."""
+    try:
+        # Check content type
+        if request.content_type != "multipart/form-data":
+            return _json_body_response(_NOT_MULTIPART_BODY, 400)
+
+        # Read multipart data, streaming the image to disk
+        upload_path, filename, size = await _async_receive_upload(coordinator, request)
+
+        # Check file size
+        if size > MAX_FILE_SIZE:
+            return _json_body_response(_TOO_LARGE_BODY, 400)
+
+        if not upload_path:
+            return _json_body_response(_NO_IMAGE_BODY, 400)
+
+        # Upload image
+        image_info = await coordinator.async_upload_image_file(upload_path, filename)
+
+        return HomeAssistantView.json(
+            {
+                "success": True,
+                "image": {
+                    "sequence": image_info["sequence"],
+                    "filename": image_info["filename"],
+                    "timestamp": image_info["timestamp"],
+                    "url": image_info["url"],
+                    "entity_id": image_info["entity_id"],
+                },
+            }
+        )
+
+    except Exception as err:
+        _LOGGER.error("Failed to upload image: %s", err)
+        return HomeAssistantView.json({"error": str(err)}, status_code=500)
+
+
+async def _handle_delete(
+    coordinator: ImageManagerCoordinator, request: web.Request
+) -> web.Response:
+    """Handle image deletion."""
+    try:
+        # An empty body cannot carry a sequence, so skip parsing it
+        if request.content_length == 0:
+            return _json_body_response(_NO_SEQUENCE_BODY, 400)
+
+        data = await request.json()
+        sequence = data.get("sequence")
+
+        if sequence is None:
+            return _json_body_response(_NO_SEQUENCE_BODY, 400)
+
+        success = await coordinator.async_delete_image(sequence)
+
+        if success:
+            return _json_body_response(_SUCCESS_BODY)
+        else:
+            return _json_body_response(_NOT_FOUND_BODY, 404)
+
+    except Exception as err:
+        _LOGGER.error("Failed to delete image: %s", err)
+        return HomeAssistantView.json({"error": str(err)}, status_code=500)
+
+
+async def _handle_clear_all(
+    coordinator: ImageManagerCoordinator, request: web.Request
+) -> web.Response:
+    """Handle clear all images."""
+    try:
+        count = await coordinator.async_delete_all_images()
+        return HomeAssistantView.json({"success": True, "deleted_count": count})
+
+    except Exception as err:
+        _LOGGER.error("Failed to clear all images: %s", err)
+        return HomeAssistantView.json({"error": str(err)}, status_code=500)
+
 
 class ImageManagerView(HomeAssistantView):
     """View to serve images from the Image Manager."""
@@ -37,10 +289,10 @@ class ImageManagerView(HomeAssistantView):
 
     async def get(self, request: web.Request, sequence: str) -> web.Response:
         """Serve an image by sequence number."""
-        try:
-            sequence_int = int(sequence)
-        except ValueError:
-            raise HTTPNotFound() from None
+        # Reject non-numeric sequences without going through int()'s ValueError
+        if not sequence.isdecimal():
+            raise HTTPNotFound()
+        sequence_int = int(sequence)
 
         # Get image path
         image_path = await self.coordinator.async_get_image_path(sequence_int)
@@ -48,19 +300,24 @@ class ImageManagerView(HomeAssistantView):
             raise HTTPNotFound()
 
         # Check if file exists
-        path_obj = Path(image_path)
-        if not path_obj.exists():
+        try:
+            st = await self.coordinator.async_get_file_stat(image_path)
+        except FileNotFoundError:
             _LOGGER.warning("Image file not found: %s", image_path)
-            raise HTTPNotFound()
+            raise HTTPNotFound() from None
+
+        # Let clients revalidate their cached copy without a new download
+        headers = _cache_headers(st)
+        if _is_not_modified(request, st):
+            return web.Response(status=304, headers=headers)
 
         # Serve the file
         try:
-            return web.FileResponse(
+            return StoredFileResponse(
                 path=image_path,
-                headers={
-                    "Content-Type": "image/jpeg",
-                    "Cache-Control": "public, max-age=3600",
-                },
+                stat_result=st,
+                chunk_size=FILE_CHUNK_SIZE,
+                headers={"Content-Type": "image/jpeg", **headers},
             )
         except Exception as err:
             _LOGGER.error("Failed to serve image %s: %s", image_path, err)
@@ -80,10 +337,10 @@ class ImageManagerPdfView(HomeAssistantView):
 
     async def get(self, request: web.Request, sequence: str) -> web.Response:
         """Serve a PDF by sequence number."""
-        try:
-            sequence_int = int(sequence)
-        except ValueError:
-            raise HTTPNotFound() from None
+        # Reject non-numeric sequences without going through int()'s ValueError
+        if not sequence.isdecimal():
+            raise HTTPNotFound()
+        sequence_int = int(sequence)
 
         # Get PDF path
         pdf_path = await self.coordinator.async_get_pdf_path(sequence_int)
@@ -91,19 +348,24 @@ class ImageManagerPdfView(HomeAssistantView):
             raise HTTPNotFound()
 
         # Check if file exists
-        path_obj = Path(pdf_path)
-        if not path_obj.exists():
+        try:
+            st = await self.coordinator.async_get_file_stat(pdf_path)
+        except FileNotFoundError:
             _LOGGER.warning("PDF file not found: %s", pdf_path)
-            raise HTTPNotFound()
+            raise HTTPNotFound() from None
+
+        # Let clients revalidate their cached copy without a new download
+        headers = _cache_headers(st)
+        if _is_not_modified(request, st):
+            return web.Response(status=304, headers=headers)
 
         # Serve the file
         try:
-            return web.FileResponse(
+            return StoredFileResponse(
                 path=pdf_path,
-                headers={
-                    "Content-Type": "application/pdf",
-                    "Cache-Control": "public, max-age=3600",
-                },
+                stat_result=st,
+                chunk_size=PDF_CHUNK_SIZE,
+                headers={"Content-Type": "application/pdf", **headers},
             )
         except Exception as err:
             _LOGGER.error("Failed to serve PDF %s: %s", pdf_path, err)
@@ -113,151 +375,35 @@ class ImageManagerPdfView(HomeAssistantView):
 class ImageManagerAPIView(HomeAssistantView):
     """API view for image manager operations."""
 
-    url = "/api/image_manager"
+    url = "/api/image_manager/{op}"
     name = "api:image_manager"
     requires_auth = True
 
     def __init__(self, coordinator: ImageManagerCoordinator) -> None:
         """Initialize the view."""
         self.coordinator = coordinator
-
-    async def get(self, request: web.Request) -> web.Response:
+        self._get_ops = {"status": self._handle_status}
+        self._post_ops = {
+            "upload": partial(_handle_upload, coordinator),
+            "delete": partial(_handle_delete, coordinator),
+            "clear_all": partial(_handle_clear_all, coordinator),
+        }
+
+    async def get(self, request: web.Request, op: str) -> web.Response:
         """Get status and list of images."""
-        path = request.path_qs.split("/")[-1]
-
-        if path == "status":
-            return await self._handle_status(request)
+        if (handler := self._get_ops.get(op)) is None:
+            return web.Response(status=404)
+        return await handler(request)
 
-        return web.Response(status=404)
-
-    async def post(self, request: web.Request) -> web.Response:
+    async def post(self, request: web.Request, op: str) -> web.Response:
         """Handle POST requests for upload, delete, and clear operations."""
-        path = request.path_qs.split("/")[-1]
-
-        if path == "upload":
-            return await self._handle_upload(request)
-        elif path == "delete":
-            return await self._handle_delete(request)
-        elif path == "clear_all":
-            return await self._handle_clear_all(request)
-
-        return web.Response(status=404)
+        if (handler := self._post_ops.get(op)) is None:
+            return web.Response(status=404)
+        return await handler(request)
 
     async def _handle_status(self, request: web.Request) -> web.Response:
         """Handle status request."""
-        try:
-            images = self.coordinator.data or []
-            max_images = self.coordinator.storage_manager.max_images
-
-            status_data = {
-                "images": [
-                    {
-                        "sequence": img["sequence"],
-                        "filename": img.get("filename", f"image_{img['sequence']}"),
-                        "timestamp": img["timestamp"],
-                        "url": f"{API_ENDPOINT}/{img['sequence']}",
-                        "entity_id": f"image.image_manager_{img['sequence']}",
-                    }
-                    for img in images
-                ],
-                "count": len(images),
-                "max_images": max_images,
-                "storage_full": len(images) >= max_images,
-            }
-
-            return web.json_response(status_data)
-        except Exception as err:
-            _LOGGER.error("Failed to get status: %s", err)
-            return web.json_response({"error": str(err)}, status=500)
-
-    async def _handle_upload(self, request: web.Request) -> web.Response:
-        """Handle image upload."""
-        try:
-            # Check content type
-            if not request.content_type.startswith("multipart/form-data"):
-                return web.json_response(
-                    {"error": "Content-Type must be multipart/form-data"}, status=400
-                )
-
-            # Read multipart data
-            reader = await request.multipart()
-            image_data = None
-            filename = None
-
-            async for field in reader:
-                if field.name == "image":
-                    image_data = await field.read()
-                    filename = field.filename
-                elif field.name == "filename":
-                    filename = await field.text()
-
-            if not image_data:
-                return web.json_response(
-                    {"error": "No image data provided"}, status=400
-                )
-
-            # Check file size
-            if len(image_data) > MAX_FILE_SIZE:
-                return web.json_response(
-                    {
-                        "error": f"File too large. Maximum size is {MAX_FILE_SIZE // (1024 * 1024)}MB"
-                    },
-                    status=400,
-                )
-
-            # Upload image
-            image_info = await self.coordinator.async_upload_image(image_data, filename)
-
-            return web.json_response(
-                {
-                    "success": True,
-                    "image": {
-                        "sequence": image_info["sequence"],
-                        "filename": image_info.get(
-                            "filename", f"image_{image_info['sequence']}"
-                        ),
-                        "timestamp": image_info["timestamp"],
-                        "url": f"{API_ENDPOINT}/{image_info['sequence']}",
-                        "entity_id": f"image.image_manager_{image_info['sequence']}",
-                    },
-                }
-            )
-
-        except Exception as err:
-            _LOGGER.error("Failed to upload image: %s", err)
-            return web.json_response({"error": str(err)}, status=500)
-
-    async def _handle_delete(self, request: web.Request) -> web.Response:
-        """Handle image deletion."""
-        try:
-            data = await request.json()
-            sequence = data.get("sequence")
-
-            if sequence is None:
-                return web.json_response(
-                    {"error": "Sequence number required"}, status=400
-                )
-
-            success = await self.coordinator.async_delete_image(sequence)
-
-            if success:
-                return web.json_response({"success": True})
-            else:
-                return web.json_response({"error": "Image not found"}, status=404)
-
-        except Exception as err:
-            _LOGGER.error("Failed to delete image: %s", err)
-            return web.json_response({"error": str(err)}, status=500)
-
-    async def _handle_clear_all(self, request: web.Request) -> web.Response:
-        """Handle clear all images."""
-        try:
-            count = await self.coordinator.async_delete_all_images()
-            return web.json_response({"success": True, "deleted_count": count})
-
-        except Exception as err:
-            _LOGGER.error("Failed to clear all images: %s", err)
-            return web.json_response({"error": str(err)}, status=500)
+        return _status_response(self.coordinator, request)
 
 
 class ImageManagerStatusView(HomeAssistantView):
@@ -273,33 +419,7 @@ class ImageManagerStatusView(HomeAssistantView):
 
     async def get(self, request: web.Request) -> web.Response:
         """Get status and list of images."""
-        try:
-            images = self.coordinator.data or []
-            max_images = self.coordinator.storage_manager.max_images
-
-            status_data = {
-                "images": [
-                    {
-                        "sequence": img["sequence"],
-                        "filename": img.get("filename", f"image_{img['sequence']}"),
-                        "timestamp": img["timestamp"],
-                        "url": f"{API_ENDPOINT}/{img['sequence']}",
-                        "pdf_url": f"{API_ENDPOINT}/{img['sequence']}/pdf"
-                        if img.get("pdf_filename")
-                        else None,
-                        "entity_id": f"image.image_manager_{img['sequence']}",
-                    }
-                    for img in images
-                ],
-                "count": len(images),
-                "max_images": max_images,
-                "storage_full": False,  # Always allow uploads, auto-rotation handles capacity
-            }
-
-            return web.json_response(status_data)
-        except Exception as err:
-            _LOGGER.error("Failed to get status: %s", err)
-            return web.json_response({"error": str(err)}, status=500)
+        return _status_response(self.coordinator, request)
 
 
 class ImageManagerUploadView(HomeAssistantView):
@@ -315,60 +435,7 @@ class ImageManagerUploadView(HomeAssistantView):
 
     async def post(self, request: web.Request) -> web.Response:
         """Handle image upload."""
-        try:
-            # Check content type
-            if not request.content_type.startswith("multipart/form-data"):
-                return web.json_response(
-                    {"error": "Content-Type must be multipart/form-data"}, status=400
-                )
-
-            # Read multipart data
-            reader = await request.multipart()
-            image_data = None
-            filename = None
-
-            async for field in reader:
-                if field.name == "image":
-                    image_data = await field.read()
-                    filename = field.filename
-                elif field.name == "filename":
-                    filename = await field.text()
-
-            if not image_data:
-                return web.json_response(
-                    {"error": "No image data provided"}, status=400
-                )
-
-            # Check file size
-            if len(image_data) > MAX_FILE_SIZE:
-                return web.json_response(
-                    {
-                        "error": f"File too large. Maximum size is {MAX_FILE_SIZE // (1024 * 1024)}MB"
-                    },
-                    status=400,
-                )
-
-            # Upload image
-            image_info = await self.coordinator.async_upload_image(image_data, filename)
-
-            return web.json_response(
-                {
-                    "success": True,
-                    "image": {
-                        "sequence": image_info["sequence"],
-                        "filename": image_info.get(
-                            "filename", f"image_{image_info['sequence']}"
-                        ),
-                        "timestamp": image_info["timestamp"],
-                        "url": f"{API_ENDPOINT}/{image_info['sequence']}",
-                        "entity_id": f"image.image_manager_{image_info['sequence']}",
-                    },
-                }
-            )
-
-        except Exception as err:
-            _LOGGER.error("Failed to upload image: %s", err)
-            return web.json_response({"error": str(err)}, status=500)
+        return await _handle_upload(self.coordinator, request)
 
 
 class ImageManagerDeleteView(HomeAssistantView):
@@ -384,25 +451,7 @@ class ImageManagerDeleteView(HomeAssistantView):
 
     async def post(self, request: web.Request) -> web.Response:
         """Handle image deletion."""
-        try:
-            data = await request.json()
-            sequence = data.get("sequence")
-
-            if sequence is None:
-                return web.json_response(
-                    {"error": "Sequence number required"}, status=400
-                )
-
-            success = await self.coordinator.async_delete_image(sequence)
-
-            if success:
-                return web.json_response({"success": True})
-            else:
-                return web.json_response({"error": "Image not found"}, status=404)
-
-        except Exception as err:
-            _LOGGER.error("Failed to delete image: %s", err)
-            return web.json_response({"error": str(err)}, status=500)
+        return await _handle_delete(self.coordinator, request)
 
 
 class ImageManagerClearAllView(HomeAssistantView):
@@ -418,10 +467,4 @@ class ImageManagerClearAllView(HomeAssistantView):
 
     async def post(self, request: web.Request) -> web.Response:
         """Handle clear all images."""
-        try:
-            count = await self.coordinator.async_delete_all_images()
-            return web.json_response({"success": True, "deleted_count": count})
-
-        except Exception as err:
-            _LOGGER.error("Failed to clear all images: %s", err)
-            return web.json_response({"error": str(err)}, status=500)
+        return await _handle_clear_all(self.coordinator, request)
@@ -0,0 +1,56 @@
+"""Regression tests for the PDF to PNG converter."""
+
+import importlib.util
+import io
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+pdfium = pytest.importorskip("pypdfium2")
+
+# Load the module by path so the integration package (and Home Assistant) is
+# not imported
+_spec = importlib.util.spec_from_file_location(
+    "pdf_to_png",
+    Path(__file__).parent.parent
+    / "custom_components"
+    / "image_manager"
+    / "pdf_to_png.py",
+)
+pdf_to_png = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(pdf_to_png)
+
+
+def _make_pdf(page_sizes):
+    doc = pdfium.PdfDocument.new()
+    for width, height in page_sizes:
+        doc.new_page(width, height)
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    doc.close()
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize(
+    "page_sizes",
+    [
+        # Renders one pixel wider than the 3840 canvas
+        [(595.28, 300)],
+        [(595.28, 841.89)],
+        [(595.28, 841.89), (841.89, 595.28), (300, 300)],
+    ],
+)
+def test_output_matches_target_size(page_sizes):
+    output = io.BytesIO()
+    pdf_to_png.pdf_to_png(_make_pdf(page_sizes), output, 3840, 2160)
+    with Image.open(io.BytesIO(output.getvalue())) as img:
+        assert img.size == (3840, 2160)
+
+
+def test_compose_clips_to_canvas():
+    page = Image.new("RGB", (12, 12), "black")
+    result = pdf_to_png._compose([(page, 5, -2)], 10, 8)
+    assert result.size == (10, 8)
+    assert result.getpixel((4, 0)) == (255, 255, 255)
+    assert result.getpixel((9, 7)) == (0, 0, 0)
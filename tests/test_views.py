@@ -0,0 +1,56 @@
+"""Tests for the Image Manager file views."""
+
+import asyncio
+import os
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from aiohttp import web  # noqa: E402
+from aiohttp.test_utils import TestClient, TestServer  # noqa: E402
+
+from custom_components.image_manager.views import ImageManagerView  # noqa: E402
+
+
+class _FakeCoordinator:
+    """Coordinator stand-in serving a single image file."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    async def async_get_image_path(self, sequence: int) -> str | None:
+        return self.path if sequence == 1 else None
+
+    async def async_get_file_stat(self, path: str) -> os.stat_result:
+        return os.stat(path)
+
+
+def test_last_modified_revalidates(tmp_path):
+    """A 304 carries the 200's Last-Modified, which revalidates again."""
+    image_path = tmp_path / "image.jpg"
+    image_path.write_bytes(b"\xff\xd8" + b"\x00" * 1024)
+    # A fractional mtime, which aiohttp rounds up in the 200's header
+    os.utime(image_path, (1_700_000_007.736, 1_700_000_007.736))
+
+    view = ImageManagerView(_FakeCoordinator(str(image_path)))
+
+    async def handler(request: web.Request) -> web.StreamResponse:
+        return await view.get(request, request.match_info["sequence"])
+
+    async def run() -> None:
+        app = web.Application()
+        app.router.add_get("/{sequence}", handler)
+        async with TestClient(TestServer(app)) as client:
+            response = await client.get("/1")
+            assert response.status == 200
+            last_modified = response.headers["Last-Modified"]
+
+            for _ in range(2):
+                response = await client.get(
+                    "/1", headers={"If-Modified-Since": last_modified}
+                )
+                assert response.status == 304
+                assert response.headers["Last-Modified"] == last_modified
+
+    asyncio.run(run())